@@ -6,59 +6,171 @@ Version: 2.0
 """
 
 import sys
-import traceback
+import time
+import asyncio
+import json
+import os
+import hashlib
+import queue
+import tempfile
+import threading
 
 # Debug mode
-DEBUG = True
+DEBUG = False
 
-def debug_print(msg):
-    if DEBUG:
+if DEBUG:
+    def debug_print(msg):
         print(f"[DigiRP] {msg}")
+else:
+    def debug_print(msg):
+        pass
 
-# Import modules
+# Import GUI modules
 try:
     debug_print("Importing modules...")
     
     import tkinter as tk
     from tkinter import ttk, messagebox, filedialog
+    from tkinter import font as tkfont
     debug_print("✓ Tkinter imported")
     
-    import pypresence
-    from pypresence import Presence
-    debug_print("✓ pypresence imported")
-    
-    import time
-    import threading
-    import json
-    import os
-    debug_print("✓ All modules loaded successfully")
-    
 except ImportError as e:
     print(f"ERROR: Missing module - {e}")
-    print("\nPlease install pypresence:")
-    print("  pip install pypresence")
     input("\nPress Enter to exit...")
     sys.exit(1)
 
+# Use orjson for presets/config when available
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+    
+    _loads = json.loads
+
+# Discord color palette
+BG_DARK = '#202225'
+BG_PANEL = '#2F3136'
+BG_MAIN = '#36393F'
+BG_INPUT = '#40444B'
+BLURPLE = '#5865F2'
+GREEN = '#43B581'
+RED = '#F04747'
+YELLOW = '#FAA61A'
+GREY = '#747F8D'
+TEXT_BRIGHT = '#FFFFFF'
+TEXT = '#DCDDDE'
+TEXT_MUTED = '#B9BBBE'
+TEXT_FAINT = '#72767d'
+
+FONT_FAMILY = 'Segoe UI'
+
+# Text-field sections of the form: (column, icon, title, fields), where each
+# field is a (label, config key) pair and None inserts a small spacer
+FORM = [
+    ('left', "⚙️", "Application Settings", [
+        ("Client ID *", 'client_id')
+    ]),
+    ('left', "📝", "Presence Text", [
+        ("Details (First Line)", 'details'),
+        ("State (Second Line)", 'state')
+    ]),
+    ('right', "🖼️", "Images", [
+        ("Large Image Key", 'large_key'),
+        ("Large Image Text (Hover)", 'large_text'),
+        None,
+        ("Small Image Key", 'small_key'),
+        ("Small Image Text (Hover)", 'small_text')
+    ]),
+    ('right', "🔗", "Buttons", [
+        ("Button 1 Label", 'button1_text'),
+        ("Button 1 URL", 'button1_url'),
+        None,
+        ("Button 2 Label", 'button2_text'),
+        ("Button 2 URL", 'button2_url')
+    ])
+]
+
+# Status label texts
+STATUS_CONNECTED = "Connected"
+STATUS_DISCONNECTED = "Disconnected"
+STATUS_CONNECTING = "Connecting…"
+STATUS_RECONNECTING = "Reconnecting…"
+STATUS_RETRY = "Reconnecting in %ds…"
+STATUS_WAITING = "Waiting for Discord…"
+MSG_UP_TO_DATE = "✔️ Presence already up to date"
+MSG_DISCORD_NOT_RUNNING = ("❌ Discord is not running!\n\nPlease:\n1. Start Discord\n"
+                           "2. Wait for it to fully load\n3. Try connecting again")
+
+# Discord accepts about five activity updates per 20 seconds, so presence
+# updates are sent at most once per this many seconds
+PRESENCE_INTERVAL = 4
+
+# Seconds between checks for Discord's IPC endpoint while it is closed
+DISCORD_PROBE_INTERVAL = 15
+
+def _discord_ipc_present():
+    """Return whether a Discord IPC socket/pipe exists, without opening it"""
+    names = [f"discord-ipc-{i}" for i in range(10)]
+    if sys.platform == 'win32':
+        # Listing the pipe namespace doesn't connect to (and use up) a pipe
+        try:
+            return any(name in names for name in os.listdir('\\\\?\\pipe\\'))
+        except OSError:
+            return False
+    # The same directories pypresence scans for the socket
+    base = os.environ.get('XDG_RUNTIME_DIR') or (
+        f"/run/user/{os.getuid()}" if os.path.isdir(f"/run/user/{os.getuid()}")
+        else tempfile.gettempdir())
+    return any(os.path.exists(os.path.join(base, sub, name))
+               for sub in ('.', '..', 'snap.discord', 'app/com.discordapp.Discord',
+                           'app/com.discordapp.DiscordCanary')
+               for name in names)
+
+# (label key, URL key) for each presence button, in display order
+BUTTON_FIELDS = (('button1_text', 'button1_url'), ('button2_text', 'button2_url'))
+
 class ModernButton(tk.Canvas):
     """Custom modern button with hover effects"""
-    def __init__(self, parent, text, command, icon="", **kwargs):
+    # Hover shade for each button color, and the disabled (bg, fg) pair
+    _LIGHTEN = {
+        GREEN: '#4CCF8F',
+        RED: '#F56565',
+        BLURPLE: '#6B75FF',
+        GREY: '#8A95A5'
+    }
+    _DISABLED = ('#4E5058', TEXT_FAINT)
+    
+    def __init__(self, parent, text, command, icon="", font=(FONT_FAMILY, 9, 'bold'), **kwargs):
         super().__init__(parent, highlightthickness=0, **kwargs)
         self.command = command
         self.text = text
         self.icon = icon
-        self.bg_color = kwargs.get('bg', '#5865F2')
+        self.bg_color = kwargs.get('bg', BLURPLE)
         self.hover_color = self.lighten_color(self.bg_color)
         self.text_color = 'white'
         self.enabled = True
         
+        # (bg, fg) for each visual state
+        self._palette = {
+            'normal': (self.bg_color, self.text_color),
+            'hover': (self.hover_color, self.text_color),
+            'disabled': self._DISABLED
+        }
+        self._fg = self.text_color
+        
         self.create_rectangle(0, 0, kwargs['width'], kwargs['height'], 
                             fill=self.bg_color, outline='', tags='bg', width=0)
         
         display_text = f"{icon} {text}" if icon else text
         self.create_text(kwargs['width']//2, kwargs['height']//2, 
                         text=display_text, fill=self.text_color, 
-                        font=('Segoe UI', 9, 'bold'), tags='text')
+                        font=font, tags='text')
         
         self.bind('<Button-1>', lambda e: self.on_click())
         self.bind('<Enter>', self.on_enter)
@@ -66,70 +178,80 @@ class ModernButton(tk.Canvas):
         
     def lighten_color(self, color):
         """Return lighter version of color for hover effect"""
-        color_map = {
-            '#43B581': '#4CCF8F',
-            '#F04747': '#F56565', 
-            '#5865F2': '#6B75FF',
-            '#747F8D': '#8A95A5'
-        }
-        return color_map.get(color, color)
+        return self._LIGHTEN.get(color, color)
         
     def on_click(self):
         if self.enabled:
             try:
                 self.command()
             except Exception as e:
-                debug_print(f"Button error: {e}")
+                if DEBUG:
+                    debug_print(f"Button error: {e}")
+        
+    def _apply_palette(self, name):
+        """Recolor the button, touching the text only when its color changes"""
+        bg, fg = self._palette[name]
+        self.itemconfig('bg', fill=bg)
+        if fg != self._fg:
+            self.itemconfig('text', fill=fg)
+            self._fg = fg
         
     def on_enter(self, e):
         if self.enabled:
-            self.itemconfig('bg', fill=self.hover_color)
+            self._apply_palette('hover')
         
     def on_leave(self, e):
         if self.enabled:
-            self.itemconfig('bg', fill=self.bg_color)
+            self._apply_palette('normal')
         
     def set_state(self, state):
-        if state == 'disabled':
-            self.itemconfig('bg', fill='#4E5058')
-            self.itemconfig('text', fill='#72767d')
-            self.enabled = False
-        else:
-            self.itemconfig('bg', fill=self.bg_color)
-            self.itemconfig('text', fill='white')
-            self.enabled = True
+        self.enabled = state != 'disabled'
+        self._apply_palette('normal' if self.enabled else 'disabled')
 
 class ModernEntry(tk.Entry):
     """Custom styled entry widget"""
-    def __init__(self, parent, **kwargs):
-        super().__init__(parent, font=('Segoe UI', 9), bg='#40444B', 
-                        fg='#DCDDDE', insertbackground='#FFFFFF',
+    def __init__(self, parent, font=(FONT_FAMILY, 9), **kwargs):
+        super().__init__(parent, font=font, bg=BG_INPUT, 
+                        fg=TEXT, insertbackground=TEXT_BRIGHT,
                         relief='flat', bd=0, **kwargs)
-        self.configure(highlightthickness=1, highlightbackground='#202225', 
-                      highlightcolor='#5865F2')
+        self.configure(highlightthickness=2, highlightbackground=BG_DARK, 
+                      highlightcolor=BLURPLE)
+
+class LogoCanvas(tk.Canvas):
+    """Round logo badge with a single letter"""
+    def __init__(self, parent, letter, font, size=50, **kwargs):
+        super().__init__(parent, width=size, height=size, highlightthickness=0, **kwargs)
+        # Items are created once; redraws go through itemconfig
+        self._bg_id = self.create_oval(5, 5, size - 5, size - 5, fill=BLURPLE,
+                                       outline='#4752C4', width=2)
+        self._text_id = self.create_text(size // 2, size // 2, text=letter,
+                                         font=font, fill='white')
+        
+    def set_letter(self, letter):
+        self.itemconfig(self._text_id, text=letter)
 
 class ScrollableFrame(tk.Frame):
     """Scrollable frame container"""
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         
-        self.canvas = tk.Canvas(self, bg='#36393F', highlightthickness=0)
+        self.canvas = tk.Canvas(self, bg=BG_MAIN, highlightthickness=0)
         
         style = ttk.Style()
         style.theme_use('default')
         style.configure("Vertical.TScrollbar", 
-                       background="#2F3136",
-                       troughcolor="#202225",
-                       bordercolor="#202225",
-                       arrowcolor="#72767d")
+                       background=BG_PANEL,
+                       troughcolor=BG_DARK,
+                       bordercolor=BG_DARK,
+                       arrowcolor=TEXT_FAINT)
         
         self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas, bg='#36393F')
+        self.scrollable_frame = tk.Frame(self.canvas, bg=BG_MAIN)
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self._scrollregion_pending = False
+        self._scrollbar_shown = True
+        self.scrollable_frame.bind("<Configure>", self._queue_scrollregion)
+        self.canvas.bind("<Configure>", self._queue_scrollregion)
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor='nw')
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -137,20 +259,47 @@ class ScrollableFrame(tk.Frame):
         self.canvas.pack(side='left', fill='both', expand=True)
         self.scrollbar.pack(side='right', fill='y')
         
-        self.bind_mousewheel()
+        # Wheel events are bound once on a private bindtag; widgets opt in
+        # by carrying the tag (see bind_mousewheel)
+        self._wheel_tag = f"Wheel{self}"
+        self.bind_class(self._wheel_tag, '<MouseWheel>',
+                        lambda e: self.canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        self.bind_class(self._wheel_tag, '<Button-4>',
+                        lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.bind_class(self._wheel_tag, '<Button-5>',
+                        lambda e: self.canvas.yview_scroll(1, "units"))
+        self.bind_mousewheel(self.canvas)
     
-    def bind_mousewheel(self):
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _bind_to_mousewheel(event):
-            self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        def _unbind_from_mousewheel(event):
-            self.canvas.unbind_all("<MouseWheel>")
-        
-        self.canvas.bind('<Enter>', _bind_to_mousewheel)
-        self.canvas.bind('<Leave>', _unbind_from_mousewheel)
+    def _queue_scrollregion(self, event=None):
+        """Recompute the scroll region once per burst of <Configure> events"""
+        if self._scrollregion_pending:
+            return
+        self._scrollregion_pending = True
+        self.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        self._scrollregion_pending = False
+        bbox = self.canvas.bbox("all")
+        self.canvas.configure(scrollregion=bbox)
+        
+        # Only show the scrollbar while the content overflows the canvas
+        needed = bool(bbox) and bbox[3] > self.canvas.winfo_height()
+        if needed and not self._scrollbar_shown:
+            self.scrollbar.pack(side='right', fill='y', before=self.canvas)
+        elif not needed and self._scrollbar_shown:
+            self.scrollbar.pack_forget()
+            self.canvas.yview_moveto(0)
+        self._scrollbar_shown = needed
+    
+    def bind_mousewheel(self, widget=None):
+        """Make widget and its children scroll the canvas with the mouse wheel"""
+        if widget is None:
+            widget = self.scrollable_frame
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            widget.bindtags((self._wheel_tag,) + tags)
+        for child in widget.winfo_children():
+            self.bind_mousewheel(child)
 
 class DiscordRPApp:
     """Main application class"""
@@ -159,76 +308,109 @@ class DiscordRPApp:
         self.root = root
         self.root.title("DigiRP - Discord Rich Presence Manager")
         self.root.geometry("800x680")
-        self.root.configure(bg='#36393F')
+        self.root.configure(bg=BG_MAIN)
         self.root.minsize(750, 600)
         
         # Variables
         self.rpc = None
         self.connected = False
-        self.update_thread = None
-        self.running = False
         self.start_timestamp = None
         self.config_file = "digirp_config.json"
+        self._save_id = None
+        self._pending_config = None
+        self._last_queued_hash = None
+        self._flash_id = None
+        self._status = (STATUS_DISCONNECTED, RED)
+        self._presence_buf = {}
+        self._last_sig = None
+        self._pending_presence = None
+        self._presence_flush_id = None
+        self._next_update_at = 0.0
+        self._loop = None
+        self._loop_thread = None
+        self._client_id = None
+        self._reconnect_id = None
+        self._backoff = 1
+        self._discord_available = None
+        # Whether the form changed since the presence was last sent
+        self._dirty = True
+        
+        # Config writes happen on a background thread; the queue holds at
+        # most one pending payload and newer saves replace it
+        self._save_q = queue.Queue(maxsize=1)
+        self._save_failed = threading.Event()
+        threading.Thread(target=self._save_worker, daemon=True).start()
         
         # Load last config
         self.load_last_config()
         
-        # Try to set icon
+        # Try to set icon; default= also applies it to later toplevels
         try:
-            if os.path.exists('icon.ico'):
-                self.root.iconbitmap('icon.ico')
-        except:
+            self.root.iconbitmap(default='icon.ico')
+        except tk.TclError:
             pass
         
+        # Shared fonts, created once and reused by every widget
+        self.fonts = {
+            'body': tkfont.Font(family=FONT_FAMILY, size=9),
+            'small': tkfont.Font(family=FONT_FAMILY, size=8),
+            'btn': tkfont.Font(family=FONT_FAMILY, size=9, weight='bold'),
+            'status': tkfont.Font(family=FONT_FAMILY, size=10, weight='bold'),
+            'section': tkfont.Font(family=FONT_FAMILY, size=11, weight='bold'),
+            'h1': tkfont.Font(family=FONT_FAMILY, size=18, weight='bold'),
+            'logo': tkfont.Font(family=FONT_FAMILY, size=24, weight='bold')
+        }
+        
         # Create UI
         self.create_ui()
         debug_print("✓ UI created successfully")
         
     def create_ui(self):
         """Create the user interface"""
+        # Input variables keyed by config name, filled in by create_input
+        self._vars = {}
+        
         # Header
-        header = tk.Frame(self.root, bg='#202225', height=90)
+        header = tk.Frame(self.root, bg=BG_DARK, height=90)
         header.pack(fill='x')
         header.pack_propagate(False)
         
         # Logo section
-        logo_frame = tk.Frame(header, bg='#202225')
+        logo_frame = tk.Frame(header, bg=BG_DARK)
         logo_frame.pack(side='left', padx=25, pady=18)
         
         # Logo
-        logo_canvas = tk.Canvas(logo_frame, width=50, height=50, bg='#202225', highlightthickness=0)
-        logo_canvas.pack(side='left')
-        logo_canvas.create_oval(5, 5, 45, 45, fill='#5865F2', outline='#4752C4', width=2)
-        logo_canvas.create_text(25, 25, text="D", font=('Segoe UI', 24, 'bold'), fill='white')
+        self.logo = LogoCanvas(logo_frame, "D", self.fonts['logo'], bg=BG_DARK)
+        self.logo.pack(side='left')
         
         # Title
-        title_frame = tk.Frame(logo_frame, bg='#202225')
+        title_frame = tk.Frame(logo_frame, bg=BG_DARK)
         title_frame.pack(side='left', padx=(15, 0))
         
-        tk.Label(title_frame, text="DigiRP", font=('Segoe UI', 18, 'bold'),
-                bg='#202225', fg='#FFFFFF').pack(anchor='w')
+        tk.Label(title_frame, text="DigiRP", font=self.fonts['h1'],
+                bg=BG_DARK, fg=TEXT_BRIGHT).pack(anchor='w')
         tk.Label(title_frame, text="Custom Discord Rich Presence Manager", 
-                font=('Segoe UI', 9), bg='#202225', fg='#B9BBBE').pack(anchor='w')
+                font=self.fonts['body'], bg=BG_DARK, fg=TEXT_MUTED).pack(anchor='w')
         
         # Status indicator
-        self.status_frame = tk.Frame(header, bg='#202225')
+        self.status_frame = tk.Frame(header, bg=BG_DARK)
         self.status_frame.pack(side='right', padx=25)
         
-        status_container = tk.Frame(self.status_frame, bg='#2F3136', relief='flat')
+        status_container = tk.Frame(self.status_frame, bg=BG_PANEL, relief='flat')
         status_container.pack(padx=12, pady=8)
         
         self.status_dot = tk.Canvas(status_container, width=14, height=14, 
-                                   bg='#2F3136', highlightthickness=0)
+                                   bg=BG_PANEL, highlightthickness=0)
         self.status_dot.pack(side='left', padx=(8, 10), pady=8)
-        self.status_dot.create_oval(2, 2, 12, 12, fill='#F04747', outline='', tags='dot')
+        self._status_dot_id = self.status_dot.create_oval(2, 2, 12, 12, fill=RED, outline='')
         
-        self.status_label = tk.Label(status_container, text="Disconnected",
-                                    font=('Segoe UI', 10, 'bold'),
-                                    bg='#2F3136', fg='#F04747')
+        self.status_label = tk.Label(status_container, text=STATUS_DISCONNECTED,
+                                    font=self.fonts['status'],
+                                    bg=BG_PANEL, fg=RED)
         self.status_label.pack(side='left', padx=(0, 12), pady=8)
         
         # Main content area
-        content_bg = tk.Frame(self.root, bg='#2F3136')
+        content_bg = tk.Frame(self.root, bg=BG_PANEL)
         content_bg.pack(fill='both', expand=True, padx=12, pady=12)
         
         # Scrollable content
@@ -238,179 +420,149 @@ class DiscordRPApp:
         content = scroll_container.scrollable_frame
         
         # Two columns layout
-        columns_container = tk.Frame(content, bg='#36393F')
+        columns_container = tk.Frame(content, bg=BG_MAIN)
         columns_container.pack(fill='both', expand=True, padx=10, pady=10)
         
-        left_col = tk.Frame(columns_container, bg='#36393F')
+        left_col = tk.Frame(columns_container, bg=BG_MAIN)
         left_col.pack(side='left', fill='both', expand=True, padx=(0, 8))
         
-        right_col = tk.Frame(columns_container, bg='#36393F')
+        right_col = tk.Frame(columns_container, bg=BG_MAIN)
         right_col.pack(side='right', fill='both', expand=True, padx=(8, 0))
         
-        # === LEFT COLUMN ===
-        self.create_section(left_col, "⚙️", "Application Settings")
-        self.create_label(left_col, "Client ID *")
-        self.client_id = self.create_input(left_col)
-        
-        self.create_section(left_col, "📝", "Presence Text")
-        self.create_label(left_col, "Details (First Line)")
-        self.details = self.create_input(left_col)
-        self.create_label(left_col, "State (Second Line)")
-        self.state = self.create_input(left_col)
-        
+        # Text fields from the FORM table
+        for column, icon, title, fields in FORM:
+            parent = left_col if column == 'left' else right_col
+            self.create_section(parent, icon, title)
+            for field in fields:
+                if field is None:
+                    tk.Frame(parent, bg=BG_MAIN, height=12).pack()
+                    continue
+                label, key = field
+                self.create_label(parent, label)
+                setattr(self, key, self.create_input(parent, key))
+        
+        # Timestamps and party size have custom layouts
         self.create_section(left_col, "⏰", "Timestamps")
         
-        ts_frame = tk.Frame(left_col, bg='#36393F')
-        ts_frame.pack(fill='x', padx=8, pady=8)
-        
         self.show_timestamp = tk.BooleanVar(value=False)
-        check_frame = tk.Frame(ts_frame, bg='#40444B', relief='flat')
-        check_frame.pack(fill='x', pady=2)
-        tk.Checkbutton(check_frame, text="Show Timestamp", variable=self.show_timestamp,
-                      bg='#40444B', fg='#DCDDDE', selectcolor='#2F3136',
-                      activebackground='#40444B', activeforeground='#FFFFFF',
-                      font=('Segoe UI', 9), command=self.toggle_timestamp).pack(anchor='w', padx=8, pady=8)
-        
-        self.ts_options = tk.Frame(left_col, bg='#36393F')
+        self.show_timestamp.trace_add('write', self._on_form_change)
+        tk.Checkbutton(left_col, text="Show Timestamp", variable=self.show_timestamp,
+                      bg=BG_INPUT, fg=TEXT, selectcolor=BG_PANEL,
+                      activebackground=BG_INPUT, activeforeground=TEXT_BRIGHT,
+                      font=self.fonts['body'], command=self.toggle_timestamp,
+                      anchor='w', padx=8, pady=8).pack(fill='x', padx=8, pady=10)
+        
+        self.ts_options = tk.Frame(left_col, bg=BG_INPUT)
         self.ts_options.pack(fill='x', padx=8, pady=4)
         
         self.timestamp_type = tk.StringVar(value="elapsed")
-        radio_frame = tk.Frame(self.ts_options, bg='#40444B')
-        radio_frame.pack(fill='x')
-        tk.Radiobutton(radio_frame, text="⏱️ Elapsed", value="elapsed",
-                      variable=self.timestamp_type, bg='#40444B', fg='#DCDDDE',
-                      selectcolor='#2F3136', activebackground='#40444B',
-                      font=('Segoe UI', 9), state='disabled').pack(side='left', padx=8, pady=6)
-        tk.Radiobutton(radio_frame, text="⏲️ Remaining", value="remaining",
-                      variable=self.timestamp_type, bg='#40444B', fg='#DCDDDE',
-                      selectcolor='#2F3136', activebackground='#40444B',
-                      font=('Segoe UI', 9), state='disabled').pack(side='left', padx=8, pady=6)
+        self.timestamp_type.trace_add('write', self._on_form_change)
+        self._ts_radios = []
+        for text, value in (("⏱️ Elapsed", "elapsed"), ("⏲️ Remaining", "remaining")):
+            radio = tk.Radiobutton(self.ts_options, text=text, value=value,
+                                  variable=self.timestamp_type, bg=BG_INPUT, fg=TEXT,
+                                  selectcolor=BG_PANEL, activebackground=BG_INPUT,
+                                  font=self.fonts['body'], state='disabled')
+            radio.pack(side='left', padx=8, pady=6)
+            self._ts_radios.append(radio)
         
         self.create_section(left_col, "👥", "Party Size")
-        party_container = tk.Frame(left_col, bg='#36393F')
+        party_container = tk.Frame(left_col, bg=BG_MAIN)
         party_container.pack(fill='x', padx=8, pady=8)
         
-        party_left = tk.Frame(party_container, bg='#36393F')
+        party_left = tk.Frame(party_container, bg=BG_MAIN)
         party_left.pack(side='left', expand=True, fill='x', padx=(0, 5))
         self.create_label(party_left, "Current", small=True)
-        self.party_size = self.create_input(party_left)
+        self.party_size = self.create_input(party_left, 'party_size')
         
-        party_right = tk.Frame(party_container, bg='#36393F')
+        party_right = tk.Frame(party_container, bg=BG_MAIN)
         party_right.pack(side='right', expand=True, fill='x', padx=(5, 0))
         self.create_label(party_right, "Max", small=True)
-        self.party_max = self.create_input(party_right)
-        
-        # === RIGHT COLUMN ===
-        self.create_section(right_col, "🖼️", "Images")
-        self.create_label(right_col, "Large Image Key")
-        self.large_key = self.create_input(right_col)
-        self.create_label(right_col, "Large Image Text (Hover)")
-        self.large_text = self.create_input(right_col)
-        
-        tk.Frame(right_col, bg='#36393F', height=12).pack()
-        
-        self.create_label(right_col, "Small Image Key")
-        self.small_key = self.create_input(right_col)
-        self.create_label(right_col, "Small Image Text (Hover)")
-        self.small_text = self.create_input(right_col)
-        
-        self.create_section(right_col, "🔗", "Buttons")
-        self.create_label(right_col, "Button 1 Label")
-        self.button1_text = self.create_input(right_col)
-        self.create_label(right_col, "Button 1 URL")
-        self.button1_url = self.create_input(right_col)
+        self.party_max = self.create_input(party_right, 'party_max')
         
-        tk.Frame(right_col, bg='#36393F', height=12).pack()
-        
-        self.create_label(right_col, "Button 2 Label")
-        self.button2_text = self.create_input(right_col)
-        self.create_label(right_col, "Button 2 URL")
-        self.button2_url = self.create_input(right_col)
+        scroll_container.bind_mousewheel()
         
         # Bottom control panel
-        bottom = tk.Frame(self.root, bg='#202225', height=75)
+        bottom = tk.Frame(self.root, bg=BG_DARK, height=75)
         bottom.pack(fill='x', side='bottom')
         bottom.pack_propagate(False)
         
-        btn_container = tk.Frame(bottom, bg='#202225')
+        btn_container = tk.Frame(bottom, bg=BG_DARK)
         btn_container.pack(pady=18)
         
         self.connect_btn = ModernButton(btn_container, "Connect", self.connect,
-                                       icon="🔌", width=115, height=42, bg='#43B581')
-        self.connect_btn.pack(side='left', padx=4)
+                                       icon="🔌", font=self.fonts['btn'], width=115, height=42, bg=GREEN)
         
         self.update_btn = ModernButton(btn_container, "Update", self.update_presence,
-                                      icon="🔄", width=115, height=42, bg='#5865F2')
-        self.update_btn.pack(side='left', padx=4)
+                                      icon="🔄", font=self.fonts['btn'], width=115, height=42, bg=BLURPLE)
         self.update_btn.set_state('disabled')
         
         self.disconnect_btn = ModernButton(btn_container, "Disconnect", self.disconnect,
-                                          icon="⏹️", width=115, height=42, bg='#F04747')
-        self.disconnect_btn.pack(side='left', padx=4)
+                                          icon="⏹️", font=self.fonts['btn'], width=115, height=42, bg=RED)
         self.disconnect_btn.set_state('disabled')
         
         clear_btn = ModernButton(btn_container, "Clear", self.clear_all,
-                               icon="🗑️", width=100, height=42, bg='#747F8D')
-        clear_btn.pack(side='left', padx=4)
+                               icon="🗑️", font=self.fonts['btn'], width=100, height=42, bg=GREY)
         
         save_btn = ModernButton(btn_container, "Save", self.save_preset,
-                               icon="💾", width=100, height=42, bg='#5865F2')
-        save_btn.pack(side='left', padx=4)
+                               icon="💾", font=self.fonts['btn'], width=100, height=42, bg=BLURPLE)
         
         load_btn = ModernButton(btn_container, "Load", self.load_preset,
-                               icon="📂", width=100, height=42, bg='#5865F2')
-        load_btn.pack(side='left', padx=4)
+                               icon="📂", font=self.fonts['btn'], width=100, height=42, bg=BLURPLE)
+        
+        # Lay the buttons out in one row
+        buttons = (self.connect_btn, self.update_btn, self.disconnect_btn,
+                   clear_btn, save_btn, load_btn)
+        for column, button in enumerate(buttons):
+            button.grid(row=0, column=column, padx=4)
         
         # Menu bar
-        menubar = tk.Menu(self.root, bg='#2F3136', fg='white')
+        menubar = tk.Menu(self.root, bg=BG_PANEL, fg='white')
         self.root.config(menu=menubar)
         
-        file_menu = tk.Menu(menubar, tearoff=0, bg='#2F3136', fg='white')
+        file_menu = tk.Menu(menubar, tearoff=0, bg=BG_PANEL, fg='white')
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Save Preset...", command=self.save_preset)
         file_menu.add_command(label="Load Preset...", command=self.load_preset)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.on_closing)
         
-        help_menu = tk.Menu(menubar, tearoff=0, bg='#2F3136', fg='white')
+        help_menu = tk.Menu(menubar, tearoff=0, bg=BG_PANEL, fg='white')
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="How to Use", command=self.show_help)
         help_menu.add_command(label="About DigiRP", command=self.show_about)
         
     def create_section(self, parent, icon, title):
         """Create a section header"""
-        frame = tk.Frame(parent, bg='#2F3136', relief='flat')
+        frame = tk.Frame(parent, bg=BG_PANEL, relief='flat')
         frame.pack(fill='x', pady=(18, 10), padx=8)
-        inner = tk.Frame(frame, bg='#2F3136')
+        inner = tk.Frame(frame, bg=BG_PANEL)
         inner.pack(fill='x', padx=10, pady=10)
-        tk.Label(inner, text=f"{icon}  {title}", font=('Segoe UI', 11, 'bold'),
-                bg='#2F3136', fg='#FFFFFF').pack(anchor='w')
-        tk.Frame(inner, bg='#5865F2', height=2).pack(fill='x', pady=(6, 0))
+        tk.Label(inner, text=f"{icon}  {title}", font=self.fonts['section'],
+                bg=BG_PANEL, fg=TEXT_BRIGHT).pack(anchor='w')
+        tk.Frame(inner, bg=BLURPLE, height=2).pack(fill='x', pady=(6, 0))
         
     def create_label(self, parent, text, small=False):
         """Create a label"""
-        frame = tk.Frame(parent, bg='#36393F')
+        frame = tk.Frame(parent, bg=BG_MAIN)
         frame.pack(fill='x', padx=8, pady=(10 if not small else 5, 3))
-        tk.Label(frame, text=text, font=('Segoe UI', 8 if small else 9),
-                bg='#36393F', fg='#B9BBBE').pack(anchor='w')
-        
-    def create_input(self, parent):
-        """Create an input field"""
-        frame = tk.Frame(parent, bg='#202225', relief='flat')
-        frame.pack(fill='x', padx=8, pady=(0, 5))
-        entry = ModernEntry(frame)
-        entry.pack(fill='x', padx=2, pady=2)
-        return entry
+        tk.Label(frame, text=text, font=self.fonts['small' if small else 'body'],
+                bg=BG_MAIN, fg=TEXT_MUTED).pack(anchor='w')
+        
+    def create_input(self, parent, key):
+        """Create an input field, register its StringVar under key and return it"""
+        var = tk.StringVar()
+        var.trace_add('write', self._on_form_change)
+        self._vars[key] = var
+        entry = ModernEntry(parent, textvariable=var, font=self.fonts['body'])
+        entry.pack(fill='x', padx=8, pady=(0, 5))
+        return var
     
     def toggle_timestamp(self):
         """Toggle timestamp options"""
         state = 'normal' if self.show_timestamp.get() else 'disabled'
-        for child in self.ts_options.winfo_children():
-            for widget in child.winfo_children():
-                try:
-                    widget.configure(state=state)
-                except:
-                    pass
+        for radio in self._ts_radios:
+            radio.configure(state=state)
     
     def connect(self):
         """Connect to Discord"""
@@ -421,39 +573,84 @@ class DiscordRPApp:
             messagebox.showerror("Error", "Please enter a Client ID!\n\nGet one at:\ndiscord.com/developers/applications")
             return
         
+        # pypresence is only imported once the user actually connects
         try:
+            from pypresence import AioPresence
+        except ImportError:
+            messagebox.showerror("Missing Module", "❌ pypresence is not installed!\n\nInstall it with:\npip install pypresence")
+            return
+        
+        # No socket/pipe means no Discord, so skip the handshake entirely
+        self._discord_available = _discord_ipc_present()
+        if not self._discord_available:
+            messagebox.showerror("Discord Not Running", MSG_DISCORD_NOT_RUNNING)
+            return
+        
+        if DEBUG:
             debug_print(f"Connecting with Client ID: {client_id}")
-            self.rpc = Presence(client_id)
-            self.rpc.connect()
+        
+        # The IPC handshake can take seconds (or time out) when Discord is
+        # slow or absent, so it runs on the RPC loop thread while Tk stays live
+        self.connect_btn.set_state('disabled')
+        self._set_status(STATUS_CONNECTING, YELLOW)
+        
+        self._client_id = client_id
+        self._start_loop()
+        self._submit(self._open_rpc(AioPresence, client_id), self._finish_connect)
+    
+    async def _open_rpc(self, AioPresence, client_id):
+        """Create and connect the presence client on the RPC loop"""
+        rpc = AioPresence(client_id, loop=asyncio.get_running_loop())
+        try:
+            await rpc.connect()
+        except Exception:
+            # The handshake can fail after the pipe is open (e.g. InvalidID)
+            if rpc.sock_writer is not None:
+                rpc.sock_writer.close()
+            raise
+        return rpc
+    
+    def _finish_connect(self, fut):
+        """Finish connecting once the handshake has completed or failed"""
+        try:
+            self.rpc = fut.result()
+            self._last_sig = None
+            self._next_update_at = 0.0
             self.connected = True
+            # Discord timestamps are Unix epoch seconds, so this must be the
+            # wall clock; use time.monotonic() for any local interval math
             self.start_timestamp = int(time.time())
             debug_print("✓ Connected successfully")
             
-            self.update_presence()
+            # Nothing to show yet if every presence field is blank;
+            # update_presence also schedules the autosave
+            if self.show_timestamp.get() or any(
+                    var.get().strip() for key, var in self._vars.items() if key != 'client_id'):
+                self.update_presence()
+            else:
+                self._schedule_save()
             
             # Update UI
-            self.status_dot.delete('dot')
-            self.status_dot.create_oval(2, 2, 12, 12, fill='#43B581', outline='', tags='dot')
-            self.status_label.config(text="Connected", fg='#43B581')
+            self._set_status(STATUS_CONNECTED, GREEN)
             
             self.connect_btn.set_state('disabled')
             self.disconnect_btn.set_state('normal')
-            self.update_btn.set_state('normal')
-            
-            # Start keep-alive thread
-            self.running = True
-            self.update_thread = threading.Thread(target=self.keep_alive, daemon=True)
-            self.update_thread.start()
+            self._set_dirty(self._dirty)
             
-            self.save_last_config()
-            messagebox.showinfo("Success", "✅ Successfully connected to Discord!\n\nYour Rich Presence is now live!")
+            self._flash_status("✅ Rich Presence is live")
             
         except Exception as e:
-            debug_print(f"Connection error: {e}")
+            if DEBUG:
+                debug_print(f"Connection error: {e}")
+            self._stop_loop(close=True)
+            self.connect_btn.set_state('normal')
+            self._set_status(STATUS_DISCONNECTED, RED)
             error_msg = str(e)
-            if "FileNotFoundError" in error_msg or "DiscordNotFound" in error_msg:
-                messagebox.showerror("Discord Not Running", 
-                                   "❌ Discord is not running!\n\nPlease:\n1. Start Discord\n2. Wait for it to fully load\n3. Try connecting again")
+            # The handshake's endpoint scan raises these when Discord is
+            # absent or has left a stale socket/pipe behind
+            from pypresence import DiscordNotFound, InvalidPipe
+            if isinstance(e, (DiscordNotFound, InvalidPipe, OSError)):
+                messagebox.showerror("Discord Not Running", MSG_DISCORD_NOT_RUNNING)
             else:
                 messagebox.showerror("Connection Error", 
                                    f"❌ Failed to connect:\n\n{error_msg}\n\nMake sure:\n• Discord is running\n• Client ID is correct")
@@ -462,27 +659,39 @@ class DiscordRPApp:
         """Disconnect from Discord"""
         debug_print("Disconnect button clicked")
         try:
-            self.running = False
+            if self._reconnect_id is not None:
+                self.root.after_cancel(self._reconnect_id)
+                self._reconnect_id = None
+            self._backoff = 1
+            if self._presence_flush_id is not None:
+                self.root.after_cancel(self._presence_flush_id)
+                self._presence_flush_id = None
+            self._pending_presence = None
             if self.rpc and self.connected:
-                self.rpc.close()
+                # AioPresence.close() is synchronous and closes the loop,
+                # so the loop thread has to be stopped first
+                self._when_stopped(self._stop_loop(), self.rpc.close)
+            elif self._loop is not None:
+                # Abandon a reconnect attempt that is still in flight
+                self._stop_loop(close=True)
             
             self.connected = False
             self.rpc = None
+            self._last_sig = None
             
             # Update UI
-            self.status_dot.delete('dot')
-            self.status_dot.create_oval(2, 2, 12, 12, fill='#F04747', outline='', tags='dot')
-            self.status_label.config(text="Disconnected", fg='#F04747')
+            self._set_status(STATUS_DISCONNECTED, RED)
             
             self.connect_btn.set_state('normal')
             self.disconnect_btn.set_state('disabled')
             self.update_btn.set_state('disabled')
             
             debug_print("✓ Disconnected successfully")
-            messagebox.showinfo("Disconnected", "✅ Rich Presence has been stopped.")
+            self._flash_status("⏹️ Rich Presence stopped", RED)
             
         except Exception as e:
-            debug_print(f"Disconnect error: {e}")
+            if DEBUG:
+                debug_print(f"Disconnect error: {e}")
             messagebox.showerror("Error", f"❌ Error disconnecting:\n{str(e)}")
     
     def update_presence(self):
@@ -492,33 +701,44 @@ class DiscordRPApp:
             messagebox.showwarning("Not Connected", "⚠️ Please connect to Discord first!")
             return
         
+        # The variable traces flag every edit, so a clean form matches the
+        # payload already sent and needs neither reading nor re-encoding
+        if not self._dirty and self._last_sig is not None:
+            self._flash_status(MSG_UP_TO_DATE)
+            return
+        
         try:
-            kwargs = {}
+            # Read every field once; the raw config is reused by the autosave.
+            # Blank fields are left out, so a key in vals means "filled in"
+            config = self.get_current_config()
+            vals = {key: val for key in self._vars if (val := config[key].strip())}
+            kwargs = self._presence_buf
+            kwargs.clear()
             
             # Text fields
-            if self.details.get().strip():
-                kwargs['details'] = self.details.get().strip()
-            if self.state.get().strip():
-                kwargs['state'] = self.state.get().strip()
+            if 'details' in vals:
+                kwargs['details'] = vals['details']
+            if 'state' in vals:
+                kwargs['state'] = vals['state']
             
             # Images
-            if self.large_key.get().strip():
-                kwargs['large_image'] = self.large_key.get().strip()
-                if self.large_text.get().strip():
-                    kwargs['large_text'] = self.large_text.get().strip()
+            if 'large_key' in vals:
+                kwargs['large_image'] = vals['large_key']
+                if 'large_text' in vals:
+                    kwargs['large_text'] = vals['large_text']
             
-            if self.small_key.get().strip():
-                kwargs['small_image'] = self.small_key.get().strip()
-                if self.small_text.get().strip():
-                    kwargs['small_text'] = self.small_text.get().strip()
+            if 'small_key' in vals:
+                kwargs['small_image'] = vals['small_key']
+                if 'small_text' in vals:
+                    kwargs['small_text'] = vals['small_text']
             
             # Party size
-            try:
-                if self.party_size.get().strip() and self.party_max.get().strip():
-                    kwargs['party_size'] = [int(self.party_size.get()), int(self.party_max.get())]
-            except ValueError:
-                messagebox.showwarning("Invalid Input", "⚠️ Party size must be numbers!")
-                return
+            if 'party_size' in vals and 'party_max' in vals:
+                party_size, party_max = vals['party_size'], vals['party_max']
+                if not (party_size.isdecimal() and party_max.isdecimal()):
+                    messagebox.showwarning("Invalid Input", "⚠️ Party size must be numbers!")
+                    return
+                kwargs['party_size'] = [int(party_size), int(party_max)]
             
             # Timestamps
             if self.show_timestamp.get():
@@ -528,627 +748,217 @@ class DiscordRPApp:
                     kwargs['end'] = int(time.time()) + 3600
             
             # Buttons
-            buttons = []
-            if self.button1_text.get().strip() and self.button1_url.get().strip():
-                buttons.append({"label": self.button1_text.get().strip()[:32], 
-                              "url": self.button1_url.get().strip()})
-            if self.button2_text.get().strip() and self.button2_url.get().strip():
-                buttons.append({"label": self.button2_text.get().strip()[:32], 
-                              "url": self.button2_url.get().strip()})
+            buttons = [{"label": vals[label][:32], "url": vals[url]}
+                       for label, url in BUTTON_FIELDS if label in vals and url in vals]
             if buttons:
                 kwargs['buttons'] = buttons
             
-            # Update presence
-            self.rpc.update(**kwargs)
-            self.save_last_config()
-            debug_print("✓ Presence updated successfully")
+            # Nothing to send if Discord already shows exactly this payload;
+            # this also drops a pending send the user has since reverted
+            sig = json.dumps(kwargs, sort_keys=True)
+            self._set_dirty(False)
+            if sig == self._last_sig:
+                self._pending_presence = None
+                self._flash_status(MSG_UP_TO_DATE)
+            else:
+                # Sends are throttled to Discord's rate limit; clicks in
+                # between collapse into one update carrying the latest values
+                self._pending_presence = (dict(kwargs), sig)
+                if self._presence_flush_id is None:
+                    delay = self._next_update_at - time.monotonic()
+                    if delay > 0:
+                        self._presence_flush_id = self.root.after(int(delay * 1000) + 1,
+                                                                  self._flush_presence)
+                    else:
+                        self._flush_presence()
+            self._schedule_save(config)
             
         except Exception as e:
-            debug_print(f"Update error: {e}")
+            if DEBUG:
+                debug_print(f"Update error: {e}")
             messagebox.showerror("Update Error", f"❌ Failed to update presence:\n\n{str(e)}")
     
-    def keep_alive(self):
-        """Keep the connection alive"""
-        while self.running and self.connected:
-            time.sleep(15)
+    def _flush_presence(self):
+        """Send the pending presence"""
+        self._presence_flush_id = None
+        pending, self._pending_presence = self._pending_presence, None
+        if pending is None or not self.connected:
+            return
+        
+        kwargs, sig = pending
+        self._last_sig = sig
+        self._next_update_at = time.monotonic() + PRESENCE_INTERVAL
+        self._submit(self.rpc.update(**kwargs), self._presence_sent)
     
-    def clear_all(self):
-        """Clear all input fields"""
-        if messagebox.askyesno("Clear All Fields", "Are you sure you want to clear all fields?"):
-            for entry in [self.details, self.state, self.large_key, self.large_text,
-                         self.small_key, self.small_text, self.button1_text,
-                         self.button1_url, self.button2_text, self.button2_url,
-                         self.party_size, self.party_max]:
-                entry.delete(0, tk.END)
-            self.show_timestamp.set(False)
-            self.toggle_timestamp()
+    def _presence_sent(self, fut):
+        """Report the outcome of a presence update"""
+        try:
+            fut.result()
+            debug_print("✓ Presence updated successfully")
+        except Exception as e:
+            if DEBUG:
+                debug_print(f"Update error: {e}")
+            # Discord may not show this payload, so allow resending it
+            self._last_sig = None
+            self._set_dirty(True)
+            from pypresence import PipeClosed, ResponseTimeout
+            if self.connected and isinstance(e, (PipeClosed, ResponseTimeout, OSError)):
+                self._connection_lost()
+            else:
+                messagebox.showerror("Update Error", f"❌ Failed to update presence:\n\n{str(e)}")
     
-    def save_preset(self):
-        """Save current configuration as preset"""
-        filename = filedialog.asksaveasfilename(
-            title="Save Preset",
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-        )
-        if filename:
-            preset = self.get_current_config()
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(preset, f, indent=2)
-                messagebox.showinfo("Success", f"✅ Preset saved successfully!\n\n{os.path.basename(filename)}")
-            except Exception as e:
-                messagebox.showerror("Error", f"❌ Failed to save preset:\n{str(e)}")
+    def _connection_lost(self):
+        """Drop a dead connection and start reconnecting"""
+        self.connected = False
+        rpc, self.rpc = self.rpc, None
+        # A queued send would only hit the dead pipe; _finish_reconnect
+        # resends the current form anyway
+        if self._presence_flush_id is not None:
+            self.root.after_cancel(self._presence_flush_id)
+            self._presence_flush_id = None
+        self._pending_presence = None
+        self._when_stopped(self._stop_loop(), self._close_rpc, rpc)
+        self.update_btn.set_state('disabled')
+        self._schedule_reconnect()
     
-    def load_preset(self):
-        """Load a preset configuration"""
-        filename = filedialog.askopenfilename(
-            title="Load Preset",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-        )
-        if filename:
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    preset = json.load(f)
-                self.apply_config(preset)
-                messagebox.showinfo("Success", f"✅ Preset loaded successfully!\n\n{os.path.basename(filename)}")
-            except Exception as e:
-                messagebox.showerror("Error", f"❌ Failed to load preset:\n{str(e)}")
+    def _close_rpc(self, rpc):
+        """Close a presence client whose pipe may already be gone"""
+        try:
+            rpc.close()
+        except Exception:
+            pass  # the pipe is already gone; this only tidies up
     
-    def get_current_config(self):
-        """Get current configuration as dictionary"""
-        return {
-            'client_id': self.client_id.get(),
-            'details': self.details.get(),
-            'state': self.state.get(),
-            'large_key': self.large_key.get(),
-            'large_text': self.large_text.get(),
-            'small_key': self.small_key.get(),
-            'small_text': self.small_text.get(),
-            'button1_text': self.button1_text.get(),
-            'button1_url': self.button1_url.get(),
-            'button2_text': self.button2_text.get(),
-            'button2_url': self.button2_url.get(),
-            'party_size': self.party_size.get(),
-            'party_max': self.party_max.get(),
-            'show_timestamp': self.show_timestamp.get(),
-            'timestamp_type': self.timestamp_type.get()
-        }
+    def _schedule_reconnect(self):
+        """Retry the connection after 1, 2, 4, ... seconds, at most 60"""
+        delay = self._backoff
+        self._backoff = min(self._backoff * 2, 60)
+        self._set_status(STATUS_RETRY % delay, YELLOW)
+        self._reconnect_id = self.root.after(delay * 1000, self._reconnect)
     
-    def apply_config(self, config):
-        """Apply a configuration dictionary"""
-        entries_map = {
-            'client_id': self.client_id,
-            'details': self.details,
-            'state': self.state,
-            'large_key': self.large_key,
-            'large_text': self.large_text,
-            'small_key': self.small_key,
-            'small_text': self.small_text,
-            'button1_text': self.button1_text,
-            'button1_url': self.button1_url,
-            'button2_text': self.button2_text,
-            'button2_url': self.button2_url,
-            'party_size': self.party_size,
-            'party_max': self.party_max
-        }
-        
-        for key, entry in entries_map.items():
-            entry.delete(0, tk.END)
-            entry.insert(0, config.get(key, ''))
-        
-        self.show_timestamp.set(config.get('show_timestamp', False))
-        self.timestamp_type.set(config.get('timestamp_type', 'elapsed'))
-        #!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-DigiRP - Modern Discord Rich Presence Manager
-Version: 2.0
-"""
-
-import sys
-import traceback
-
-# Debug mode
-DEBUG = False
-
-def debug_print(msg):
-    if DEBUG:
-        print(f"[DigiRP] {msg}")
-
-# Import modules
-try:
-    import tkinter as tk
-    from tkinter import ttk, messagebox, filedialog
-    import pypresence
-    from pypresence import Presence
-    import time
-    import threading
-    import json
-    import os
+    def _reconnect(self):
+        """Start a reconnect attempt on a fresh RPC loop"""
+        from pypresence import AioPresence
+        self._reconnect_id = None
+        # While Discord is closed, poll for its endpoint at a slow fixed
+        # pace instead of running handshakes; the backoff resumes after
+        self._discord_available = _discord_ipc_present()
+        if not self._discord_available:
+            self._set_status(STATUS_WAITING, YELLOW)
+            self._reconnect_id = self.root.after(DISCORD_PROBE_INTERVAL * 1000, self._reconnect)
+            return
+        self._set_status(STATUS_RECONNECTING, YELLOW)
+        self._start_loop()
+        self._submit(self._open_rpc(AioPresence, self._client_id), self._finish_reconnect)
     
-except ImportError as e:
-    print(f"ERROR: Missing module - {e}")
-    print("\nPlease install pypresence:")
-    print("  pip install pypresence")
-    input("\nPress Enter to exit...")
-    sys.exit(1)
-
-class ModernButton(tk.Canvas):
-    """Custom modern button with hover effects"""
-    def __init__(self, parent, text, command, icon="", **kwargs):
-        super().__init__(parent, highlightthickness=0, **kwargs)
-        self.command = command
-        self.text = text
-        self.icon = icon
-        self.bg_color = kwargs.get('bg', '#5865F2')
-        self.hover_color = self.lighten_color(self.bg_color)
-        self.text_color = 'white'
-        self.enabled = True
-        
-        # Rounded corners effect
-        self.create_rectangle(0, 0, kwargs['width'], kwargs['height'], 
-                            fill=self.bg_color, outline='', tags='bg', width=0)
-        
-        display_text = f"{icon} {text}" if icon else text
-        self.create_text(kwargs['width']//2, kwargs['height']//2, 
-                        text=display_text, fill=self.text_color, 
-                        font=('Segoe UI', 10, 'bold'), tags='text')
-        
-        self.bind('<Button-1>', lambda e: self.on_click())
-        self.bind('<Enter>', self.on_enter)
-        self.bind('<Leave>', self.on_leave)
-        
-    def lighten_color(self, color):
-        color_map = {
-            '#43B581': '#4CCF8F',
-            '#F04747': '#F56565', 
-            '#5865F2': '#6B75FF',
-            '#747F8D': '#8A95A5'
-        }
-        return color_map.get(color, color)
-        
-    def on_click(self):
-        if self.enabled:
-            try:
-                self.command()
-            except Exception as e:
-                debug_print(f"Button error: {e}")
-        
-    def on_enter(self, e):
-        if self.enabled:
-            self.itemconfig('bg', fill=self.hover_color)
-        
-    def on_leave(self, e):
-        if self.enabled:
-            self.itemconfig('bg', fill=self.bg_color)
-        
-    def set_state(self, state):
-        if state == 'disabled':
-            self.itemconfig('bg', fill='#4E5058')
-            self.itemconfig('text', fill='#72767d')
-            self.enabled = False
-        else:
-            self.itemconfig('bg', fill=self.bg_color)
-            self.itemconfig('text', fill='white')
-            self.enabled = True
-
-class ModernEntry(tk.Entry):
-    """Custom styled entry widget"""
-    def __init__(self, parent, **kwargs):
-        super().__init__(parent, font=('Segoe UI', 10), bg='#40444B', 
-                        fg='#DCDDDE', insertbackground='#FFFFFF',
-                        relief='flat', bd=0, **kwargs)
-        self.configure(highlightthickness=1, highlightbackground='#202225', 
-                      highlightcolor='#5865F2')
-
-class DiscordRPApp:
-    """Main application class"""
-    def __init__(self, root):
-        self.root = root
-        self.root.title("DigiRP - Discord Rich Presence Manager")
-        self.root.geometry("900x700")
-        self.root.configure(bg='#36393F')
-        self.root.minsize(850, 650)
-        
-        # Variables
-        self.rpc = None
-        self.connected = False
-        self.update_thread = None
-        self.running = False
-        self.start_timestamp = None
-        self.config_file = "digirp_config.json"
-        
-        # Load last config
-        self.load_last_config()
-        
-        # Try to set icon
+    def _finish_reconnect(self, fut):
+        """Resume after a successful reconnect, or schedule the next attempt"""
         try:
-            if os.path.exists('icon.ico'):
-                self.root.iconbitmap('icon.ico')
-        except:
-            pass
-        
-        # Create UI
-        self.create_ui()
-        
-    def create_ui(self):
-        """Create the user interface"""
-        # Header
-        header = tk.Frame(self.root, bg='#202225', height=100)
-        header.pack(fill='x')
-        header.pack_propagate(False)
-        
-        # Logo and title (centered)
-        header_content = tk.Frame(header, bg='#202225')
-        header_content.place(relx=0.5, rely=0.5, anchor='center')
-        
-        # Logo
-        logo_canvas = tk.Canvas(header_content, width=60, height=60, bg='#202225', highlightthickness=0)
-        logo_canvas.pack(side='left', padx=(0, 15))
-        logo_canvas.create_oval(5, 5, 55, 55, fill='#5865F2', outline='#4752C4', width=3)
-        logo_canvas.create_text(30, 30, text="D", font=('Segoe UI', 28, 'bold'), fill='white')
-        
-        # Title
-        title_frame = tk.Frame(header_content, bg='#202225')
-        title_frame.pack(side='left')
-        
-        tk.Label(title_frame, text="DigiRP", font=('Segoe UI', 24, 'bold'),
-                bg='#202225', fg='#FFFFFF').pack()
-        tk.Label(title_frame, text="Custom Discord Rich Presence Manager", 
-                font=('Segoe UI', 10), bg='#202225', fg='#B9BBBE').pack()
-        
-        # Status indicator (top right)
-        status_container = tk.Frame(header, bg='#2F3136')
-        status_container.place(relx=0.98, rely=0.5, anchor='e')
-        
-        self.status_dot = tk.Canvas(status_container, width=16, height=16, 
-                                   bg='#2F3136', highlightthickness=0)
-        self.status_dot.pack(side='left', padx=(12, 10), pady=10)
-        self.status_dot.create_oval(3, 3, 13, 13, fill='#F04747', outline='', tags='dot')
-        
-        self.status_label = tk.Label(status_container, text="Disconnected",
-                                    font=('Segoe UI', 11, 'bold'),
-                                    bg='#2F3136', fg='#F04747')
-        self.status_label.pack(side='left', padx=(0, 15), pady=10)
-        
-        # Main content container with max width
-        main_container = tk.Frame(self.root, bg='#36393F')
-        main_container.pack(fill='both', expand=True, pady=20)
-        
-        # Content frame (centered with max width)
-        content_frame = tk.Frame(main_container, bg='#36393F')
-        content_frame.place(relx=0.5, rely=0.5, anchor='center', width=850, height=500)
-        
-        # Two columns layout
-        left_col = tk.Frame(content_frame, bg='#2F3136')
-        left_col.place(relx=0, rely=0, relwidth=0.48, relheight=1)
-        
-        right_col = tk.Frame(content_frame, bg='#2F3136')
-        right_col.place(relx=0.52, rely=0, relwidth=0.48, relheight=1)
-        
-        # Create canvas for scrolling
-        left_canvas = tk.Canvas(left_col, bg='#2F3136', highlightthickness=0)
-        left_scrollbar = ttk.Scrollbar(left_col, orient='vertical', command=left_canvas.yview)
-        left_scrollable = tk.Frame(left_canvas, bg='#2F3136')
-        
-        left_scrollable.bind("<Configure>", lambda e: left_canvas.configure(scrollregion=left_canvas.bbox("all")))
-        left_canvas.create_window((0, 0), window=left_scrollable, anchor='nw')
-        left_canvas.configure(yscrollcommand=left_scrollbar.set)
-        
-        left_canvas.pack(side='left', fill='both', expand=True)
-        left_scrollbar.pack(side='right', fill='y')
-        
-        right_canvas = tk.Canvas(right_col, bg='#2F3136', highlightthickness=0)
-        right_scrollbar = ttk.Scrollbar(right_col, orient='vertical', command=right_canvas.yview)
-        right_scrollable = tk.Frame(right_canvas, bg='#2F3136')
-        
-        right_scrollable.bind("<Configure>", lambda e: right_canvas.configure(scrollregion=right_canvas.bbox("all")))
-        right_canvas.create_window((0, 0), window=right_scrollable, anchor='nw')
-        right_canvas.configure(yscrollcommand=right_scrollbar.set)
-        
-        right_canvas.pack(side='left', fill='both', expand=True)
-        right_scrollbar.pack(side='right', fill='y')
-        
-        # Mouse wheel binding
-        def _on_mousewheel(event, canvas):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        left_canvas.bind_all("<MouseWheel>", lambda e: _on_mousewheel(e, left_canvas))
-        right_canvas.bind_all("<MouseWheel>", lambda e: _on_mousewheel(e, right_canvas))
-        
-        # === LEFT COLUMN ===
-        self.create_section(left_scrollable, "⚙️", "Application Settings")
-        self.create_label(left_scrollable, "Client ID *")
-        self.client_id = self.create_input(left_scrollable)
-        
-        self.create_section(left_scrollable, "📝", "Presence Text")
-        self.create_label(left_scrollable, "Details (First Line)")
-        self.details = self.create_input(left_scrollable)
-        self.create_label(left_scrollable, "State (Second Line)")
-        self.state = self.create_input(left_scrollable)
-        
-        self.create_section(left_scrollable, "⏰", "Timestamps")
-        
-        ts_frame = tk.Frame(left_scrollable, bg='#2F3136')
-        ts_frame.pack(fill='x', padx=15, pady=8)
-        
-        self.show_timestamp = tk.BooleanVar(value=False)
-        check_frame = tk.Frame(ts_frame, bg='#40444B')
-        check_frame.pack(fill='x', pady=5)
-        tk.Checkbutton(check_frame, text="Show Timestamp", variable=self.show_timestamp,
-                      bg='#40444B', fg='#DCDDDE', selectcolor='#2F3136',
-                      activebackground='#40444B', activeforeground='#FFFFFF',
-                      font=('Segoe UI', 10), command=self.toggle_timestamp).pack(anchor='w', padx=10, pady=10)
-        
-        self.ts_options = tk.Frame(left_scrollable, bg='#2F3136')
-        self.ts_options.pack(fill='x', padx=15, pady=5)
-        
-        self.timestamp_type = tk.StringVar(value="elapsed")
-        radio_frame = tk.Frame(self.ts_options, bg='#40444B')
-        radio_frame.pack(fill='x')
-        tk.Radiobutton(radio_frame, text="⏱️ Elapsed", value="elapsed",
-                      variable=self.timestamp_type, bg='#40444B', fg='#DCDDDE',
-                      selectcolor='#2F3136', activebackground='#40444B',
-                      font=('Segoe UI', 10), state='disabled').pack(side='left', padx=10, pady=8)
-        tk.Radiobutton(radio_frame, text="⏲️ Remaining", value="remaining",
-                      variable=self.timestamp_type, bg='#40444B', fg='#DCDDDE',
-                      selectcolor='#2F3136', activebackground='#40444B',
-                      font=('Segoe UI', 10), state='disabled').pack(side='left', padx=10, pady=8)
-        
-        self.create_section(left_scrollable, "👥", "Party Size")
-        party_container = tk.Frame(left_scrollable, bg='#2F3136')
-        party_container.pack(fill='x', padx=15, pady=8)
-        
-        party_left = tk.Frame(party_container, bg='#2F3136')
-        party_left.pack(side='left', expand=True, fill='x', padx=(0, 5))
-        self.create_label(party_left, "Current")
-        self.party_size = self.create_input(party_left)
-        
-        party_right = tk.Frame(party_container, bg='#2F3136')
-        party_right.pack(side='right', expand=True, fill='x', padx=(5, 0))
-        self.create_label(party_right, "Max")
-        self.party_max = self.create_input(party_right)
-        
-        # === RIGHT COLUMN ===
-        self.create_section(right_scrollable, "🖼️", "Images")
-        self.create_label(right_scrollable, "Large Image Key")
-        self.large_key = self.create_input(right_scrollable)
-        self.create_label(right_scrollable, "Large Image Text (Hover)")
-        self.large_text = self.create_input(right_scrollable)
-        
-        tk.Frame(right_scrollable, bg='#2F3136', height=15).pack()
-        
-        self.create_label(right_scrollable, "Small Image Key")
-        self.small_key = self.create_input(right_scrollable)
-        self.create_label(right_scrollable, "Small Image Text (Hover)")
-        self.small_text = self.create_input(right_scrollable)
-        
-        self.create_section(right_scrollable, "🔗", "Buttons")
-        self.create_label(right_scrollable, "Button 1 Label")
-        self.button1_text = self.create_input(right_scrollable)
-        self.create_label(right_scrollable, "Button 1 URL")
-        self.button1_url = self.create_input(right_scrollable)
-        
-        tk.Frame(right_scrollable, bg='#2F3136', height=15).pack()
-        
-        self.create_label(right_scrollable, "Button 2 Label")
-        self.button2_text = self.create_input(right_scrollable)
-        self.create_label(right_scrollable, "Button 2 URL")
-        self.button2_url = self.create_input(right_scrollable)
-        
-        # Bottom control panel (centered)
-        bottom = tk.Frame(self.root, bg='#202225', height=85)
-        bottom.pack(fill='x', side='bottom')
-        bottom.pack_propagate(False)
-        
-        btn_container = tk.Frame(bottom, bg='#202225')
-        btn_container.place(relx=0.5, rely=0.5, anchor='center')
-        
-        self.connect_btn = ModernButton(btn_container, "Connect", self.connect,
-                                       icon="🔌", width=120, height=45, bg='#43B581')
-        self.connect_btn.pack(side='left', padx=5)
-        
-        self.update_btn = ModernButton(btn_container, "Update", self.update_presence,
-                                      icon="🔄", width=120, height=45, bg='#5865F2')
-        self.update_btn.pack(side='left', padx=5)
-        self.update_btn.set_state('disabled')
-        
-        self.disconnect_btn = ModernButton(btn_container, "Disconnect", self.disconnect,
-                                          icon="⏹️", width=130, height=45, bg='#F04747')
-        self.disconnect_btn.pack(side='left', padx=5)
-        self.disconnect_btn.set_state('disabled')
-        
-        clear_btn = ModernButton(btn_container, "Clear", self.clear_all,
-                               icon="🗑️", width=100, height=45, bg='#747F8D')
-        clear_btn.pack(side='left', padx=5)
-        
-        save_btn = ModernButton(btn_container, "Save", self.save_preset,
-                               icon="💾", width=100, height=45, bg='#5865F2')
-        save_btn.pack(side='left', padx=5)
-        
-        load_btn = ModernButton(btn_container, "Load", self.load_preset,
-                               icon="📂", width=100, height=45, bg='#5865F2')
-        load_btn.pack(side='left', padx=5)
-        
-        # Menu bar
-        menubar = tk.Menu(self.root)
-        self.root.config(menu=menubar)
-        
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Save Preset...", command=self.save_preset)
-        file_menu.add_command(label="Load Preset...", command=self.load_preset)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.on_closing)
-        
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="How to Use", command=self.show_help)
-        help_menu.add_command(label="About DigiRP", command=self.show_about)
-        
-    def create_section(self, parent, icon, title):
-        """Create a section header"""
-        frame = tk.Frame(parent, bg='#2F3136')
-        frame.pack(fill='x', pady=(20, 10), padx=15)
-        
-        tk.Label(frame, text=f"{icon}  {title}", font=('Segoe UI', 12, 'bold'),
-                bg='#2F3136', fg='#FFFFFF').pack(anchor='w')
+            self.rpc = fut.result()
+        except Exception as e:
+            if DEBUG:
+                debug_print(f"Reconnect error: {e}")
+            self._stop_loop(close=True)
+            self._schedule_reconnect()
+            return
         
-        tk.Frame(frame, bg='#5865F2', height=3).pack(fill='x', pady=(8, 0))
+        self.connected = True
+        self._backoff = 1
+        self._next_update_at = 0.0
+        self._set_status(STATUS_CONNECTED, GREEN)
+        self._set_dirty(True)
         
-    def create_label(self, parent, text):
-        """Create a label"""
-        tk.Label(parent, text=text, font=('Segoe UI', 9),
-                bg='#2F3136', fg='#B9BBBE').pack(anchor='w', padx=15, pady=(10, 5))
-        
-    def create_input(self, parent):
-        """Create an input field"""
-        entry = ModernEntry(parent)
-        entry.pack(fill='x', padx=15, pady=(0, 5))
-        entry.configure(bd=8)
-        return entry
+        # Discord dropped the old activity along with the pipe
+        self.update_presence()
     
-    def toggle_timestamp(self):
-        """Toggle timestamp options"""
-        state = 'normal' if self.show_timestamp.get() else 'disabled'
-        for child in self.ts_options.winfo_children():
-            for widget in child.winfo_children():
-                try:
-                    widget.configure(state=state)
-                except:
-                    pass
+    def _on_form_change(self, *args):
+        """Variable trace: enable Update once the form differs from Discord"""
+        if not self._dirty:
+            self._set_dirty(True)
     
-    def connect(self):
-        """Connect to Discord"""
-        client_id = self.client_id.get().strip()
-        
-        if not client_id:
-            messagebox.showerror("Error", "Please enter a Client ID!\n\nGet one at:\ndiscord.com/developers/applications")
-            return
-        
-        try:
-            self.rpc = Presence(client_id)
-            self.rpc.connect()
-            self.connected = True
-            self.start_timestamp = int(time.time())
-            
-            self.update_presence()
-            
-            # Update UI
-            self.status_dot.delete('dot')
-            self.status_dot.create_oval(3, 3, 13, 13, fill='#43B581', outline='', tags='dot')
-            self.status_label.config(text="Connected", fg='#43B581')
-            
-            self.connect_btn.set_state('disabled')
-            self.disconnect_btn.set_state('normal')
-            self.update_btn.set_state('normal')
-            
-            # Start keep-alive thread
-            self.running = True
-            self.update_thread = threading.Thread(target=self.keep_alive, daemon=True)
-            self.update_thread.start()
-            
-            self.save_last_config()
-            messagebox.showinfo("Success", "✅ Connected to Discord!\n\nYour Rich Presence is now live!")
-            
-        except Exception as e:
-            error_msg = str(e)
-            if "FileNotFoundError" in error_msg or "DiscordNotFound" in error_msg:
-                messagebox.showerror("Discord Not Running", 
-                                   "❌ Discord is not running!\n\nPlease start Discord first.")
-            else:
-                messagebox.showerror("Error", f"❌ Failed to connect:\n\n{error_msg}")
+    def _set_dirty(self, dirty):
+        """Record whether Update has anything new to send and enable it to match"""
+        # A "remaining" countdown restarts from now on every update, so the
+        # form never matches what Discord shows while it is on
+        if self.show_timestamp.get() and self.timestamp_type.get() == "remaining":
+            dirty = True
+        self._dirty = dirty
+        self.update_btn.set_state('normal' if dirty and self.connected else 'disabled')
     
-    def disconnect(self):
-        """Disconnect from Discord"""
-        try:
-            self.running = False
-            if self.rpc and self.connected:
-                self.rpc.close()
-            
-            self.connected = False
-            self.rpc = None
-            
-            # Update UI
-            self.status_dot.delete('dot')
-            self.status_dot.create_oval(3, 3, 13, 13, fill='#F04747', outline='', tags='dot')
-            self.status_label.config(text="Disconnected", fg='#F04747')
-            
-            self.connect_btn.set_state('normal')
-            self.disconnect_btn.set_state('disabled')
-            self.update_btn.set_state('disabled')
-            
-            messagebox.showinfo("Disconnected", "✅ Rich Presence stopped.")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"❌ Error: {str(e)}")
+    def _start_loop(self):
+        """Start the asyncio loop thread that owns the Discord connection"""
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_loop, args=(self._loop,),
+                                             daemon=True)
+        self._loop_thread.start()
     
-    def update_presence(self):
-        """Update the Rich Presence"""
-        if not self.connected or not self.rpc:
-            messagebox.showwarning("Warning", "⚠️ Please connect first!")
-            return
-        
-        try:
-            kwargs = {}
-            
-            if self.details.get().strip():
-                kwargs['details'] = self.details.get().strip()
-            if self.state.get().strip():
-                kwargs['state'] = self.state.get().strip()
-            
-            if self.large_key.get().strip():
-                kwargs['large_image'] = self.large_key.get().strip()
-                if self.large_text.get().strip():
-                    kwargs['large_text'] = self.large_text.get().strip()
-            
-            if self.small_key.get().strip():
-                kwargs['small_image'] = self.small_key.get().strip()
-                if self.small_text.get().strip():
-                    kwargs['small_text'] = self.small_text.get().strip()
-            
-            try:
-                if self.party_size.get().strip() and self.party_max.get().strip():
-                    kwargs['party_size'] = [int(self.party_size.get()), int(self.party_max.get())]
-            except ValueError:
-                messagebox.showwarning("Invalid Input", "⚠️ Party size must be numbers!")
-                return
-            
-            if self.show_timestamp.get():
-                if self.timestamp_type.get() == "elapsed":
-                    kwargs['start'] = self.start_timestamp
-                else:
-                    kwargs['end'] = int(time.time()) + 3600
-            
-            buttons = []
-            if self.button1_text.get().strip() and self.button1_url.get().strip():
-                buttons.append({"label": self.button1_text.get().strip()[:32], 
-                              "url": self.button1_url.get().strip()})
-            if self.button2_text.get().strip() and self.button2_url.get().strip():
-                buttons.append({"label": self.button2_text.get().strip()[:32], 
-                              "url": self.button2_url.get().strip()})
-            if buttons:
-                kwargs['buttons'] = buttons
-            
-            self.rpc.update(**kwargs)
-            self.save_last_config()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"❌ Failed to update:\n\n{str(e)}")
+    def _run_loop(self, loop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+    
+    def _stop_loop(self, close=False):
+        """Stop the RPC loop thread and return it, waiting up to a second"""
+        loop, thread = self._loop, self._loop_thread
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=1.0)
+        self._loop = self._loop_thread = None
+        if close:
+            self._when_stopped(thread, loop.close)
+        return thread
+    
+    def _when_stopped(self, thread, func, *args):
+        """Call func(*args) on the Tk thread once the loop thread has exited"""
+        # A blocking call on the RPC loop can outlast the join, and closing
+        # a loop that is still in run_forever() raises
+        if thread.is_alive():
+            self.root.after(100, self._when_stopped, thread, func, *args)
+        else:
+            func(*args)
+    
+    def _submit(self, coro, callback):
+        """Run coro on the RPC loop and call callback(future) on the Tk thread"""
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        self._when_done(fut, callback, self._loop)
+    
+    def _when_done(self, fut, callback, loop):
+        """Poll fut from the Tk loop; Tk must not be called from other threads"""
+        if fut.done():
+            callback(fut)
+        elif loop is self._loop:
+            # Still the live loop, even if its thread hasn't reached
+            # run_forever() yet
+            self.root.after(20, self._when_done, fut, callback, loop)
+        else:
+            # _stop_loop has retired this loop; nothing will finish fut now
+            fut.cancel()
+    
+    def _flash_status(self, msg, color=GREEN, ms=2500):
+        """Show a success message in the status label for a moment"""
+        if self._flash_id is not None:
+            self.root.after_cancel(self._flash_id)
+        self.status_label.config(text=msg, fg=color)
+        self._flash_id = self.root.after(ms, self._restore_status)
+    
+    def _restore_status(self):
+        """Put the connection state back into the status label"""
+        self._flash_id = None
+        text, color = self._status
+        self.status_label.config(text=text, fg=color)
     
-    def keep_alive(self):
-        """Keep the connection alive"""
-        while self.running and self.connected:
-            time.sleep(15)
+    def _set_status(self, text, color):
+        """Show a connection state; it replaces any flash in progress"""
+        if self._flash_id is not None:
+            self.root.after_cancel(self._flash_id)
+            self._flash_id = None
+        self._status = (text, color)
+        self.status_dot.itemconfig(self._status_dot_id, fill=color)
+        self.status_label.config(text=text, fg=color)
     
     def clear_all(self):
         """Clear all input fields"""
-        if messagebox.askyesno("Clear All", "Clear all fields?"):
-            for entry in [self.details, self.state, self.large_key, self.large_text,
-                         self.small_key, self.small_text, self.button1_text,
-                         self.button1_url, self.button2_text, self.button2_url,
-                         self.party_size, self.party_max]:
-                entry.delete(0, tk.END)
+        if messagebox.askyesno("Clear All Fields", "Are you sure you want to clear all fields?"):
+            for key, var in self._vars.items():
+                if key != 'client_id':
+                    var.set("")
             self.show_timestamp.set(False)
             self.toggle_timestamp()
     
@@ -1162,11 +972,11 @@ class DiscordRPApp:
         if filename:
             preset = self.get_current_config()
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(preset, f, indent=2)
-                messagebox.showinfo("Success", f"✅ Preset saved!\n\n{os.path.basename(filename)}")
-            except Exception as e:
-                messagebox.showerror("Error", f"❌ Failed to save:\n{str(e)}")
+                with open(filename, 'wb') as f:
+                    f.write(_dumps(preset))
+                self._flash_status(f"💾 Saved {os.path.basename(filename)}")
+            except OSError as e:
+                messagebox.showerror("Error", f"❌ Failed to save preset:\n{str(e)}")
     
     def load_preset(self):
         """Load a preset configuration"""
@@ -1176,77 +986,94 @@ class DiscordRPApp:
         )
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    preset = json.load(f)
+                with open(filename, 'rb') as f:
+                    preset = _loads(f.read())
+                if not isinstance(preset, dict):
+                    raise ValueError("not a DigiRP preset")
                 self.apply_config(preset)
-                messagebox.showinfo("Success", f"✅ Preset loaded!\n\n{os.path.basename(filename)}")
-            except Exception as e:
-                messagebox.showerror("Error", f"❌ Failed to load:\n{str(e)}")
+                self._flash_status(f"📂 Loaded {os.path.basename(filename)}")
+            except (OSError, ValueError, tk.TclError) as e:
+                messagebox.showerror("Error", f"❌ Failed to load preset:\n{str(e)}")
     
     def get_current_config(self):
         """Get current configuration as dictionary"""
-        return {
-            'client_id': self.client_id.get(),
-            'details': self.details.get(),
-            'state': self.state.get(),
-            'large_key': self.large_key.get(),
-            'large_text': self.large_text.get(),
-            'small_key': self.small_key.get(),
-            'small_text': self.small_text.get(),
-            'button1_text': self.button1_text.get(),
-            'button1_url': self.button1_url.get(),
-            'button2_text': self.button2_text.get(),
-            'button2_url': self.button2_url.get(),
-            'party_size': self.party_size.get(),
-            'party_max': self.party_max.get(),
-            'show_timestamp': self.show_timestamp.get(),
-            'timestamp_type': self.timestamp_type.get()
-        }
+        config = {key: var.get() for key, var in self._vars.items()}
+        config['show_timestamp'] = self.show_timestamp.get()
+        config['timestamp_type'] = self.timestamp_type.get()
+        return config
     
     def apply_config(self, config):
         """Apply a configuration dictionary"""
-        entries_map = {
-            'client_id': self.client_id,
-            'details': self.details,
-            'state': self.state,
-            'large_key': self.large_key,
-            'large_text': self.large_text,
-            'small_key': self.small_key,
-            'small_text': self.small_text,
-            'button1_text': self.button1_text,
-            'button1_url': self.button1_url,
-            'button2_text': self.button2_text,
-            'button2_url': self.button2_url,
-            'party_size': self.party_size,
-            'party_max': self.party_max
-        }
+        # Check the flag before touching any field, so a bad preset is
+        # rejected without leaving the form half-applied
+        show_timestamp = config.get('show_timestamp', False)
+        if not isinstance(show_timestamp, int):
+            raise ValueError("show_timestamp must be true or false")
         
-        for key, entry in entries_map.items():
-            entry.delete(0, tk.END)
-            entry.insert(0, config.get(key, ''))
+        for key, var in self._vars.items():
+            var.set(config.get(key, ''))
         
-        self.show_timestamp.set(config.get('show_timestamp', False))
+        self.show_timestamp.set(show_timestamp)
         self.timestamp_type.set(config.get('timestamp_type', 'elapsed'))
         self.toggle_timestamp()
     
+    def _schedule_save(self, config=None):
+        """Debounce saving the last configuration (an optional pre-read snapshot)"""
+        if self._save_id is not None:
+            self.root.after_cancel(self._save_id)
+        self._pending_config = config
+        self._save_id = self.root.after(2000, self.save_last_config)
+    
     def save_last_config(self):
-        """Save current configuration to file"""
+        """Save the pending or current configuration to file if it changed"""
+        self._save_id = None
+        config = self._pending_config or self.get_current_config()
+        self._pending_config = None
+        payload = _dumps(config)
+        # Compare with the last payload handed to the writer, not the last
+        # one it finished, so reverting to a just-written config still
+        # replaces a newer one that is queued
+        digest = hashlib.blake2b(payload, digest_size=8).digest()
+        # A failed write leaves the file stale, so let the next save through
+        if self._save_failed.is_set():
+            self._save_failed.clear()
+            self._last_queued_hash = None
+        if digest == self._last_queued_hash:
+            return
+        self._last_queued_hash = digest
+        
         try:
-            config = self.get_current_config()
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-        except:
+            self._save_q.get_nowait()
+            self._save_q.task_done()
+        except queue.Empty:
             pass
+        self._save_q.put_nowait(payload)
+    
+    def _save_worker(self):
+        """Write queued config payloads to disk"""
+        while True:
+            payload = self._save_q.get()
+            # Write to a temp file first so a crash can't leave half-written JSON
+            tmp_file = self.config_file + '.tmp'
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.config_file)
+            except OSError:
+                self._save_failed.set()
+            finally:
+                self._save_q.task_done()
     
     def load_last_config(self):
         """Load last saved configuration"""
+        # Missing, unreadable or corrupt files all mean "no last config";
+        # orjson's and json's decode errors are both ValueErrors
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.last_config = json.load(f)
-            else:
-                self.last_config = None
-        except:
+            with open(self.config_file, 'rb') as f:
+                self.last_config = _loads(f.read())
+        except (OSError, ValueError):
+            self.last_config = None
+        if not isinstance(self.last_config, dict):
             self.last_config = None
     
     def show_help(self):
@@ -1294,28 +1121,46 @@ Created with Python & pypresence"""
     
     def on_closing(self):
         """Handle window close event"""
-        if self.connected:
-            if messagebox.askyesno("Exit", "Disconnect and exit?"):
-                self.disconnect()
-                time.sleep(0.3)
-                self.root.destroy()
-        else:
-            self.root.destroy()
+        if self._save_id is not None:
+            self.root.after_cancel(self._save_id)
+            self.save_last_config()
+        # Let the writer finish before the daemon thread dies with the app
+        self._save_q.join()
+        
+        if self.connected and not messagebox.askyesno("Exit", "Disconnect and exit?"):
+            return
+        
+        # disconnect() also cancels a pending reconnect and stops the RPC
+        # loop thread, so nothing is left running against a closed pipe
+        if self.connected or self._loop is not None or self._reconnect_id is not None:
+            self.disconnect()
+        self.root.destroy()
 
 def main():
     """Main entry point"""
     try:
         root = tk.Tk()
+        
+        # Non-threaded Tcl builds poll for events, sleeping this long between
+        # polls (default 20 ms); the form only reacts to clicks and typing
+        getattr(tk._tkinter, 'setbusywaitinterval', lambda ms: None)(50)
+        
         app = DiscordRPApp(root)
         
         # Load last config
         if hasattr(app, 'last_config') and app.last_config:
-            app.apply_config(app.last_config)
+            # A hand-edited autosave with bad values shouldn't stop startup;
+            # apply_config checks everything before setting any of it
+            try:
+                app.apply_config(app.last_config)
+            except (ValueError, tk.TclError) as e:
+                debug_print(f"Ignoring invalid last config: {e}")
         
         root.protocol("WM_DELETE_WINDOW", app.on_closing)
         root.mainloop()
         
     except Exception as e:
+        import traceback
         print(f"\nFATAL ERROR: {e}")
         traceback.print_exc()
         messagebox.showerror("Fatal Error", f"Failed to start:\n\n{str(e)}")